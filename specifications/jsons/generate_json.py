@@ -1,190 +1,362 @@
 import json
-import uuid
+import base64
 import pickle
 import gzip
+import mmap
+import functools
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Dict, Iterable, List, Optional, Union, Tuple
 import re
 import os
+import sys
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时使用标准库 json
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # 未安装 zstandard 时使用 gzip 压缩
+    zstandard = None
+
+# 预编译的正则表达式
+_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# YYYY/M/D、YYYY-M-D 或只有年份；月日之间的分隔符必须与前一个一致
+_DATE_ALL = re.compile(r'(\d{4})(?:([-/])(\d{1,2})\2(\d{1,2}))?')
+_CONF_STRIP = re.compile(r'\b\d{4}\b|\b\d+(?:st|nd|rd|th)\b')  # 会议名称中的年份和届数，如 2023、25th
+_CITATION_NUM = re.compile(r'\d+')
+_WIDE_INT = re.compile(rb'\d{19}')  # 可能超出64位整数范围的数字
+
+# 作者名字中的特殊标记（通讯作者等），用 str.translate 一次删除
+_AUTHOR_MARK_TABLE = str.maketrans('', '', '*†‡§¶')
+
+# 缺失值占位符，驻留后所有记录共享同一个字符串对象
+_NA = sys.intern('n/a')
+
+
+def _split_date(date_str: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+    """不使用正则拆分 YYYY、YYYY/M/D 或 YYYY-M-D 格式的日期，返回(年, 月, 日)，格式不符时返回 None"""
+    year = date_str[:4]
+    if not (len(year) == 4 and year.isdecimal()):
+        return None
+    if len(date_str) == 4:  # 只有年份
+        return year, None, None
+    
+    separator = date_str[4]
+    if separator not in '-/':
+        return None
+    parts = date_str[5:].split(separator)
+    if len(parts) != 2:
+        return None
+    month, day = parts
+    if 1 <= len(month) <= 2 and 1 <= len(day) <= 2 and month.isdecimal() and day.isdecimal():
+        return year, month, day
+    return None
+
+
+# pickle 文件读写缓冲区大小 (1 MB)，减少大文件的系统调用次数
+_IO_BUFFER_SIZE = 1 << 20
+
+# 文件大小单位，从大到小排列
+_SIZE_UNITS = (('GB', 1024 ** 3), ('MB', 1024 ** 2), ('KB', 1024))
+
+
+def _human_size(size: int) -> str:
+    """将字节数格式化为易读的文件大小"""
+    for unit, divisor in _SIZE_UNITS:
+        if size >= divisor:
+            return f"{size / divisor:.2f} {unit}"
+    return f"{size} bytes"
+
+
+def _encode_id(raw: bytes) -> str:
+    """将16字节随机数编码为22位URL安全base64字符串（去掉填充的 '='）"""
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """解析日期字符串，返回标准格式（结果缓存，同一日期只解析一次）"""
+    if not date_str:
+        return None
+    
+    # 标准格式直接拆分，不经过正则
+    parts = _split_date(date_str.strip())
+    if parts:
+        year, month, day = parts
+        if month is None:  # 只有年份
+            return f"{year}-01-01"
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    
+    # 其他格式按前缀匹配，如 "2019/7" 解析为年份
+    match = _DATE_ALL.match(date_str.strip())
+    if match:
+        year, _, month, day = match.groups()
+        if month is None:  # 只有年份
+            return f"{year}-01-01"
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    
+    return date_str  # 如果无法解析，返回原字符串
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_citations_cached(citation_str: str) -> int:
+    """从引用字符串中提取数字（结果缓存）"""
+    if not citation_str:
+        return 0
+    
+    # 常见情况是纯数字字符串（如 "138"），直接转换，不走正则
+    stripped = citation_str.strip()
+    if stripped.isdecimal():
+        return int(stripped)
+    
+    # 提取数字（如 "Cited by 138"）
+    match = _CITATION_NUM.search(stripped)
+    return int(match.group()) if match else 0
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_name_cached(full_name: str) -> Tuple[str, str]:
+    """解析姓名为名和姓（结果缓存，同一作者在多篇论文中重复出现）"""
+    if not full_name:
+        return _NA, _NA
+    
+    # 最多切分一次：第一个为名，其余为姓（姓中连续的空白合并为一个空格）
+    name_parts = full_name.split(None, 1)
+    if not name_parts:
+        return _NA, _NA
+    if len(name_parts) == 1:
+        # 只有一个名字，假设为姓
+        return _NA, name_parts[0]
+    return name_parts[0], ' '.join(name_parts[1].split())
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_conference_name_cached(conference_name: str) -> str:
+    """标准化会议名称，去除年份和届数（结果缓存）"""
+    if not conference_name:
+        return conference_name
+    
+    # 一次扫描同时去除年份 (4位数字) 和届数 (如 25th, 1st, 2nd, 3rd, 11th等)，
+    # 再用 split/join 合并多余的空格
+    return ' '.join(_CONF_STRIP.sub('', conference_name).split())
+
+
+@dataclass(slots=True)
+class PaperRecord:
+    """论文记录（使用 __slots__，比字典更省内存）"""
+    id: str = _NA
+    title: str = _NA
+    type: str = _NA
+    authors: List[str] = field(default_factory=list)
+    corresponding_authors: List[str] = field(default_factory=list)
+    publication_date: Optional[str] = None
+    publication_year: Optional[str] = None
+    venue_id: Optional[str] = None
+    volume: Optional[str] = None
+    issue: Optional[str] = None
+    pages: str = _NA
+    publisher: str = _NA
+    abstract: str = _NA
+    total_citations: int = 0
+    created_at: str = _NA
+    _title_lower: str = field(default='', repr=False, compare=False)  # 搜索用的小写标题
+    _extra: Dict = field(default_factory=dict, repr=False, compare=False)  # 文件中的其他字段，导出时原样保留
+    
+    def to_dict(self) -> Dict:
+        """转换为字典（不含内部字段，附加文件中的其他字段），用于导出和保存"""
+        record = {name: getattr(self, name) for name in _PAPER_FIELDS}
+        if self._extra:
+            record.update(self._extra)
+        return record
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PaperRecord':
+        """从导出或保存的字典恢复论文记录，缺失的字段使用默认值，其他字段保留在 _extra 中"""
+        known = {name: data[name] for name in _PAPER_FIELDS if name in data}
+        extra = {key: value for key, value in data.items() if key not in _PAPER_FIELD_SET}
+        return cls(**known, _extra=extra)
+
+
+# 论文记录的公开字段（按定义顺序），用于与字典相互转换
+_PAPER_FIELDS = tuple(f.name for f in fields(PaperRecord) if not f.name.startswith('_'))
+_PAPER_FIELD_SET = frozenset(_PAPER_FIELDS)
+
 
 class AcademicPaperDatabase:
     def __init__(self):
         self.papers = {}
         self.authors = {}
         self.venues = {}  # 期刊和会议的统一存储
+        self._author_by_name = {}  # (名, 姓) 小写 -> 作者ID列表
+        self._venue_by_key = {}  # (类型, 名称小写) -> 期刊/会议ID
+        self._papers_by_year = {}  # 发表年份 -> 论文ID列表
+        self._papers_by_type = {}  # 论文类型 -> 论文ID列表
+        # 延迟累加的引用数 [(ID, 引用数)]，由 finalize() 写回记录
+        self._pending_author_citations = []
+        self._pending_venue_citations = []
+        # 随论文添加增量维护的统计信息，供 get_database_stats 直接读取
+        self._total_citations = 0
+        self._paper_count_by_year = {}  # 发表年份 -> 论文数量
+        self._paper_count_by_type = {}  # 论文类型 -> 论文数量
+        self._most_cited_paper_id = None
+        self._max_citations = 0
         
     def _generate_id(self) -> str:
-        """生成唯一ID"""
-        return str(uuid.uuid4())
+        """生成唯一ID（16字节随机数的22位URL安全base64编码）"""
+        return _encode_id(os.urandom(16))
     
     def _validate_email(self, email: str) -> bool:
         """验证邮箱格式"""
         if not email:
             return True  # 允许空邮箱
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email.strip()))
+        return bool(_EMAIL.match(email.strip()))
     
     def _validate_date(self, date_str: str) -> bool:
         """验证日期格式"""
         if not date_str:
             return False
         
-        date_patterns = [
-            r'^\d{4}/\d{1,2}/\d{1,2}$',  # YYYY/M/D
-            r'^\d{4}-\d{1,2}-\d{1,2}$',  # YYYY-M-D
-            r'^\d{4}$',  # 只有年份
-        ]
-        
-        return any(re.match(pattern, date_str.strip()) for pattern in date_patterns)
+        # 与解析使用同一个拆分函数，要求整个字符串符合格式
+        return _split_date(date_str.strip()) is not None
     
     def _parse_date(self, date_str: str) -> Optional[str]:
         """解析日期字符串，返回标准格式"""
-        if not date_str:
-            return None
-        
-        # 尝试解析不同的日期格式
-        date_patterns = [
-            r'(\d{4})/(\d{1,2})/(\d{1,2})',  # YYYY/M/D
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',  # YYYY-M-D
-            r'(\d{4})',  # 只有年份
-        ]
-        
-        for pattern in date_patterns:
-            match = re.match(pattern, date_str.strip())
-            if match:
-                if len(match.groups()) == 1:  # 只有年份
-                    return f"{match.group(1)}-01-01"
-                else:
-                    year, month, day = match.groups()
-                    return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-        
-        return date_str  # 如果无法解析，返回原字符串
+        return _parse_date_cached(date_str)
     
     def _extract_year_from_date(self, date_str: str) -> Optional[str]:
-        """从日期字符串中提取年份"""
-        if not date_str:
+        """从日期字符串中提取年份（前4位必须是数字）"""
+        if not date_str or len(date_str) < 4:
             return None
-        return date_str[:4] if len(date_str) >= 4 else None
+        year = date_str[:4]
+        return year if year.isdecimal() else None
     
     def _parse_name(self, full_name: str) -> Tuple[str, str]:
         """解析姓名为名和姓"""
-        if not full_name:
-            return "n/a", "n/a"
-        
-        name_parts = full_name.strip().split()
-        if len(name_parts) == 1:
-            # 只有一个名字，假设为姓
-            return "n/a", name_parts[0]
-        elif len(name_parts) == 2:
-            # 假设第一个是名，第二个是姓
-            return name_parts[0], name_parts[1]
-        else:
-            # 多个名字，第一个为名，其余为姓
-            return name_parts[0], " ".join(name_parts[1:])
+        return _parse_name_cached(full_name)
     
     def _normalize_conference_name(self, conference_name: str) -> str:
         """标准化会议名称，去除年份和届数"""
-        if not conference_name:
-            return conference_name
-        
-        # 去除年份信息 (4位数字)
-        conference_name = re.sub(r'\b\d{4}\b', '', conference_name)
-        
-        # 去除届数信息 (如 25th, 1st, 2nd, 3rd, 11th等)
-        conference_name = re.sub(r'\b\d+(st|nd|rd|th)\b', '', conference_name)
-        
-        # 去除多余的空格
-        conference_name = re.sub(r'\s+', ' ', conference_name).strip()
-        
-        return conference_name
+        return _normalize_conference_name_cached(conference_name)
     
-    def _parse_authors(self, authors_str: str) -> tuple[List[str], List[str]]:
-        """解析作者字符串，返回(作者ID列表, 通讯作者ID列表)"""
+    def _parse_authors(self, authors_str: str, affiliations: List[str] = None,
+                       emails: List[str] = None) -> tuple[List[str], List[str]]:
+        """解析作者字符串，返回(作者ID列表, 通讯作者ID列表)
+        
+        单位和邮箱按作者顺序对应，在查找或创建作者时直接使用
+        """
         if not authors_str:
             return [], []
         
+        affiliations = affiliations or []
+        emails = emails or []
         authors = []
         corresponding_authors = []
         author_names = [name.strip() for name in authors_str.split(',')]
+        # 同一篇论文中已确定的作者不再参与匹配，避免同名合作者被合并为一人
+        resolved_ids = set()
         
         for name in author_names:
             # 检查是否是通讯作者
             is_corresponding = '*' in name
             # 移除作者名字中的特殊标记
-            clean_name = re.sub(r'[*†‡§¶]', '', name).strip()
+            clean_name = name.translate(_AUTHOR_MARK_TABLE).strip()
             
             if clean_name:
-                author_id = self._get_or_create_author_by_name(clean_name)
+                index = len(authors)
+                affiliation = affiliations[index] if index < len(affiliations) else None
+                email = emails[index] if index < len(emails) else None
+                
+                first_name, last_name = self._parse_name(clean_name)
+                author_id = self._get_or_create_author(first_name, last_name,
+                                                       affiliation or None, email or None,
+                                                       exclude_ids=resolved_ids)
+                resolved_ids.add(author_id)
                 authors.append(author_id)
                 if is_corresponding:
                     corresponding_authors.append(author_id)
         
         return authors, corresponding_authors
     
-    def _get_or_create_author_by_name(self, name: str) -> str:
-        """仅通过姓名获取或创建作者（临时方法）"""
-        first_name, last_name = self._parse_name(name)
-        return self._get_or_create_author(first_name, last_name)
-    
-    def _author_similarity_score(self, author1: Dict, first_name: str, last_name: str, 
-                               affiliation: str = None, email: str = None) -> float:
-        """计算作者相似度分数"""
-        score = 0.0
-        
+    def _author_similarity_score(self, author1: Dict, first_lc: str, last_lc: str, 
+                               affiliation_lc: str = '', email_lc: str = '') -> float:
+        """计算作者相似度分数（查询参数均为小写形式，与作者记录中缓存的小写字段比较）"""
         # 姓名匹配 (权重: 0.5)
-        if (author1.get('first_name', '').lower() == (first_name or '').lower() and 
-            author1.get('last_name', '').lower() == (last_name or '').lower()):
-            score += 0.5
+        # 单位和邮箱最多只能贡献 0.5，达不到阈值 0.7，姓名不一致时直接返回
+        if author1['_lc_first'] != first_lc or author1['_lc_last'] != last_lc:
+            return 0.0
+        score = 0.5
+        
+        # 没有单位和邮箱可比较时无需继续
+        if not affiliation_lc and not email_lc:
+            return score
         
         # 单位匹配 (权重: 0.3)
-        if affiliation and author1.get('affiliation') and author1.get('affiliation') != 'n/a':
-            if affiliation.lower() == author1['affiliation'].lower():
+        stored_affiliation = author1['_lc_affiliation']
+        if affiliation_lc and stored_affiliation:
+            if affiliation_lc == stored_affiliation:
                 score += 0.3
-            elif affiliation.lower() in author1['affiliation'].lower() or \
-                 author1['affiliation'].lower() in affiliation.lower():
+            elif affiliation_lc in stored_affiliation or stored_affiliation in affiliation_lc:
                 score += 0.15  # 部分匹配
         
         # 邮箱匹配 (权重: 0.2)
-        if email and author1.get('email') and author1.get('email') != 'n/a':
-            if email.lower() == author1['email'].lower():
-                score += 0.2
+        if email_lc and author1['_lc_email'] and email_lc == author1['_lc_email']:
+            score += 0.2
         
         return score
     
     def _get_or_create_author(self, first_name: str, last_name: str, 
-                            affiliation: str = None, email: str = None) -> str:
-        """获取或创建作者，返回作者ID"""
+                            affiliation: str = None, email: str = None,
+                            exclude_ids: Optional[set] = None) -> str:
+        """获取或创建作者，返回作者ID（exclude_ids 中的作者不参与匹配）"""
+        # 查询条件只转换一次小写
+        first_lc = (first_name or '').lower()
+        last_lc = (last_name or '').lower()
+        affiliation_lc = (affiliation or '').lower()
+        email_lc = (email or '').lower()
+        
         # 检查是否已存在相似的作者 (相似度阈值: 0.7)
-        best_match_id = None
+        # 姓名不一致时相似度最高为 0.5，因此只需比较同名的作者；
+        # 没有单位和邮箱时同名作者也只有 0.5，无需比较
+        best_match = None
         best_score = 0.0
         
-        for author_id, author_info in self.authors.items():
-            score = self._author_similarity_score(author_info, first_name, last_name, 
-                                                affiliation, email)
+        authors_dict = self.authors
+        candidates = self._author_by_name.get((first_lc, last_lc), ()) if affiliation_lc or email_lc else ()
+        for author_id in candidates:
+            if exclude_ids and author_id in exclude_ids:
+                continue
+            author_info = authors_dict[author_id]
+            score = self._author_similarity_score(author_info, first_lc, last_lc, 
+                                                affiliation_lc, email_lc)
             if score > best_score and score >= 0.7:
-                best_match_id = author_id
+                best_match = author_info
                 best_score = score
         
-        if best_match_id:
-            # 更新作者信息（如果提供了新信息）
-            if affiliation and self.authors[best_match_id].get('affiliation') == 'n/a':
-                self.authors[best_match_id]['affiliation'] = affiliation
-            if email and self.authors[best_match_id].get('email') == 'n/a':
-                self.authors[best_match_id]['email'] = email
-            return best_match_id
+        if best_match is not None:
+            # 更新作者信息（如果提供了新信息），同时刷新缓存的小写字段
+            if affiliation and best_match.get('affiliation') == _NA:
+                best_match['affiliation'] = affiliation
+                best_match['_lc_affiliation'] = affiliation_lc
+            if email and best_match.get('email') == _NA:
+                best_match['email'] = email
+                best_match['_lc_email'] = email_lc
+            return best_match['id']
         
         # 创建新作者
         author_id = self._generate_id()
         self.authors[author_id] = {
             'id': author_id,
-            'first_name': first_name or 'n/a',
-            'last_name': last_name or 'n/a',
-            'full_name': f"{first_name} {last_name}".strip() if first_name and last_name else 'n/a',
-            'affiliation': affiliation or 'n/a',
-            'email': email or 'n/a',
-            'papers': [],
+            'first_name': first_name or _NA,
+            'last_name': last_name or _NA,
+            'affiliation': affiliation or _NA,
+            'email': email or _NA,
+            'papers': {},  # 论文ID的有序集合（只用键）
             'total_citations': 0
         }
+        self._index_author(self.authors[author_id])
         
         return author_id
     
@@ -200,27 +372,22 @@ class AcademicPaperDatabase:
             normalized_name = venue_name
         
         # 检查是否已存在该期刊/会议
-        for venue_id, venue_info in self.venues.items():
-            # 安全地获取存储的名称
-            if venue_type == 'conference':
-                stored_name = venue_info.get('normalized_name', venue_info.get('name', ''))
-            else:
-                stored_name = venue_info.get('name', '')
+        venue_id = self._venue_by_key.get((venue_type, normalized_name.lower()))
+        if venue_id:
+            venue_info = self.venues[venue_id]
+            # 更新分类信息（如果提供了新信息）
+            if cas_division and venue_info.get('cas_division') == _NA:
+                venue_info['cas_division'] = cas_division
+            if jcr_division and venue_info.get('jcr_division') == _NA:
+                venue_info['jcr_division'] = jcr_division
+            if ccf_class and venue_info.get('ccf_class') == _NA:
+                venue_info['ccf_class'] = ccf_class
+                
+            # 为旧的会议记录添加 normalized_name 字段
+            if venue_type == 'conference' and 'normalized_name' not in venue_info:
+                venue_info['normalized_name'] = normalized_name
                 
-            if stored_name.lower() == normalized_name.lower():
-                # 更新分类信息（如果提供了新信息）
-                if cas_division and venue_info.get('cas_division') == 'n/a':
-                    self.venues[venue_id]['cas_division'] = cas_division
-                if jcr_division and venue_info.get('jcr_division') == 'n/a':
-                    self.venues[venue_id]['jcr_division'] = jcr_division
-                if ccf_class and venue_info.get('ccf_class') == 'n/a':
-                    self.venues[venue_id]['ccf_class'] = ccf_class
-                    
-                # 为旧的会议记录添加 normalized_name 字段
-                if venue_type == 'conference' and 'normalized_name' not in venue_info:
-                    self.venues[venue_id]['normalized_name'] = normalized_name
-                    
-                return venue_id
+            return venue_id
         
         # 创建新期刊/会议
         venue_id = self._generate_id()
@@ -228,33 +395,139 @@ class AcademicPaperDatabase:
             'id': venue_id,
             'name': venue_name,
             'type': venue_type,  # 'journal' 或 'conference'
-            'publisher': publisher or 'n/a',
-            'papers': [],
+            'publisher': publisher or _NA,
+            'papers': {},  # 论文ID的有序集合（只用键）
             'total_citations': 0
         }
         
         # 添加会议特有字段
         if venue_type == 'conference':
             venue_record['normalized_name'] = normalized_name
-            venue_record['ccf_class'] = ccf_class or 'n/a'
+            venue_record['ccf_class'] = ccf_class or _NA
         
         # 添加期刊特有字段
         if venue_type == 'journal':
-            venue_record['cas_division'] = cas_division or 'n/a'  # 中科院分区
-            venue_record['jcr_division'] = jcr_division or 'n/a'  # JCR分区
-            venue_record['ccf_class'] = ccf_class or 'n/a'       # CCF分类
+            venue_record['cas_division'] = cas_division or _NA  # 中科院分区
+            venue_record['jcr_division'] = jcr_division or _NA  # JCR分区
+            venue_record['ccf_class'] = ccf_class or _NA       # CCF分类
         
         self.venues[venue_id] = venue_record
+        self._index_venue(venue_record)
         return venue_id
     
+    def _index_author(self, author: Dict):
+        """将作者加入姓名索引，并缓存相似度计算和搜索使用的小写字段"""
+        first_lower = author.get('first_name', '').lower()
+        last_lower = author.get('last_name', '').lower()
+        author['_lc_first'] = first_lower
+        author['_lc_last'] = last_lower
+        author['_name_lower'] = f"{first_lower} {last_lower}"
+        # 'n/a' 表示未知，缓存为空字符串，不参与单位和邮箱匹配
+        affiliation = author.get('affiliation')
+        email = author.get('email')
+        author['_lc_affiliation'] = affiliation.lower() if affiliation and affiliation != _NA else ''
+        author['_lc_email'] = email.lower() if email and email != _NA else ''
+        self._author_by_name.setdefault((first_lower, last_lower), []).append(author['id'])
+    
+    def _index_venue(self, venue: Dict):
+        """将期刊/会议按 (类型, 名称) 加入索引（同名时保留最早的记录）"""
+        if venue.get('type') == 'conference':
+            name = venue.get('normalized_name', venue.get('name', ''))
+        else:
+            name = venue.get('name', '')
+        self._venue_by_key.setdefault((venue.get('type'), name.lower()), venue['id'])
+    
+    def _index_paper(self, paper: PaperRecord):
+        """将论文加入年份和类型索引，并缓存小写标题供搜索使用"""
+        paper._title_lower = paper.title.lower()
+        if paper.publication_year:
+            self._papers_by_year.setdefault(paper.publication_year, []).append(paper.id)
+        self._papers_by_type.setdefault(paper.type, []).append(paper.id)
+    
+    def _count_paper(self, paper: PaperRecord):
+        """将论文计入统计信息"""
+        self._total_citations += paper.total_citations
+        year = paper.publication_year
+        self._paper_count_by_year[year] = self._paper_count_by_year.get(year, 0) + 1
+        self._paper_count_by_type[paper.type] = self._paper_count_by_type.get(paper.type, 0) + 1
+        if paper.total_citations > self._max_citations:
+            self._max_citations = paper.total_citations
+            self._most_cited_paper_id = paper.id
+    
+    def _recompute_stats(self):
+        """加载数据后重新计算统计信息"""
+        self._total_citations = 0
+        self._paper_count_by_year = {}
+        self._paper_count_by_type = {}
+        self._most_cited_paper_id = None
+        self._max_citations = 0
+        for paper in self.papers.values():
+            self._count_paper(paper)
+    
+    @staticmethod
+    def _public_fields(record: Dict) -> Dict:
+        """返回去除以下划线开头的内部字段后的记录副本，论文集合转换为列表"""
+        public = {k: v for k, v in record.items() if not k.startswith('_')}
+        if 'papers' in public:
+            public['papers'] = list(public['papers'])
+        return public
+    
+    @staticmethod
+    def _full_name(author: Dict) -> str:
+        """由名和姓拼接全名（不单独存储），忽略缺失的部分，都缺失时返回 'n/a'"""
+        parts = [name for name in (author.get('first_name'), author.get('last_name'))
+                 if name and name != _NA]
+        return ' '.join(parts) if parts else _NA
+    
+    def _public_author(self, author: Dict) -> Dict:
+        """返回作者的公开字段副本，在姓之后补上全名，与原有记录格式一致"""
+        record = {}
+        for key, value in self._public_fields(author).items():
+            record[key] = value
+            if key == 'last_name':
+                record['full_name'] = self._full_name(author)
+        return record
+    
+    def _authors_as_dicts(self) -> Dict[str, Dict]:
+        """将作者记录转换为导出格式"""
+        return {author_id: self._public_author(author) for author_id, author in self.authors.items()}
+    
+    def _strip_private_fields(self, records: Dict[str, Dict]) -> Dict[str, Dict]:
+        """去除所有记录中的内部字段（用于导出）"""
+        return {record_id: self._public_fields(record) for record_id, record in records.items()}
+    
+    def _papers_as_dicts(self) -> Dict[str, Dict]:
+        """将论文记录转换为字典（用于导出和保存）"""
+        return {paper_id: paper.to_dict() for paper_id, paper in self.papers.items()}
+    
+    @staticmethod
+    def _papers_from_dicts(papers: Dict[str, Dict]) -> Dict[str, PaperRecord]:
+        """将导出或保存的论文字典恢复为论文记录"""
+        # 缺少 id 字段时使用字典的键
+        return {paper_id: PaperRecord.from_dict({'id': paper_id, **paper}) for paper_id, paper in papers.items()}
+    
+    def _rebuild_indexes(self):
+        """加载数据后重建内部索引和缓存字段"""
+        self._author_by_name = {}
+        self._venue_by_key = {}
+        self._papers_by_year = {}
+        self._papers_by_type = {}
+        self._pending_author_citations = []
+        self._pending_venue_citations = []
+        for author in self.authors.values():
+            author['papers'] = dict.fromkeys(author.get('papers', ()))
+            author.pop('full_name', None)  # 全名按需拼接，不再存储
+            self._index_author(author)
+        for venue in self.venues.values():
+            venue['papers'] = dict.fromkeys(venue.get('papers', ()))
+            self._index_venue(venue)
+        for paper in self.papers.values():
+            self._index_paper(paper)
+        self._recompute_stats()
+    
     def _extract_citations(self, citation_str: str) -> int:
         """从引用字符串中提取数字"""
-        if not citation_str:
-            return 0
-        
-        # 提取数字
-        match = re.search(r'(\d+)', citation_str)
-        return int(match.group(1)) if match else 0
+        return _extract_citations_cached(citation_str)
     
     def add_paper(self, 
                   title: str,
@@ -272,7 +545,10 @@ class AcademicPaperDatabase:
                   author_emails: List[str] = None,
                   cas_division: str = None,
                   jcr_division: str = None,
-                  ccf_class: str = None) -> str:
+                  ccf_class: str = None,
+                  *,
+                  _paper_id: str = None,
+                  _created_at: str = None) -> str:
         """
         添加论文到数据库
         
@@ -293,6 +569,8 @@ class AcademicPaperDatabase:
             cas_division: 中科院分区（期刊）
             jcr_division: JCR分区（期刊）
             ccf_class: CCF分类
+            _paper_id: 预先生成的论文ID（批量添加时使用）
+            _created_at: 预先生成的创建时间（批量添加时使用）
             
         Returns:
             str: 论文ID
@@ -323,30 +601,10 @@ class AcademicPaperDatabase:
                 if email and not self._validate_email(email):
                     raise ValueError(f"邮箱格式不正确: {email}")
         
-        # 解析作者信息
-        author_ids, corresponding_author_ids = self._parse_authors(authors)
-        
-        # 处理作者的详细信息
-        if author_affiliations or author_emails:
-            author_affiliations = author_affiliations or []
-            author_emails = author_emails or []
-            
-            # 确保列表长度匹配
-            while len(author_affiliations) < len(author_ids):
-                author_affiliations.append(None)
-            while len(author_emails) < len(author_ids):
-                author_emails.append(None)
-            
-            # 更新作者信息
-            for i, author_id in enumerate(author_ids):
-                affiliation = author_affiliations[i] if i < len(author_affiliations) else None
-                email = author_emails[i] if i < len(author_emails) else None
-                
-                if author_id in self.authors:
-                    if affiliation and self.authors[author_id].get('affiliation') == 'n/a':
-                        self.authors[author_id]['affiliation'] = affiliation
-                    if email and self.authors[author_id].get('email') == 'n/a':
-                        self.authors[author_id]['email'] = email
+        # 解析作者信息（同时使用单位和邮箱匹配已有作者）
+        author_ids, corresponding_author_ids = self._parse_authors(
+            authors, author_affiliations, author_emails
+        )
         
         # 解析日期
         parsed_date = self._parse_date(publication_date)
@@ -363,44 +621,103 @@ class AcademicPaperDatabase:
         # 处理引用数
         citations_count = self._extract_citations(total_citations)
         
+        # 摘要过长时截断，只有需要截断时才切片
+        if abstract and len(abstract) > 1000:
+            abstract = abstract[:1000] + '...'
+        
         # 生成论文ID
-        paper_id = self._generate_id()
+        paper_id = _paper_id or self._generate_id()
         
         # 创建论文记录
-        paper_record = {
-            'id': paper_id,
-            'title': title.strip(),
-            'type': paper_type,
-            'authors': author_ids,
-            'corresponding_authors': corresponding_author_ids,
-            'publication_date': parsed_date,
-            'publication_year': publication_year,
-            'venue_id': venue_id,
-            'volume': volume,
-            'issue': issue,
-            'pages': pages or 'n/a',
-            'publisher': publisher or 'n/a',
-            'abstract': abstract[:1000] + '...' if abstract and len(abstract) > 1000 else (abstract or 'n/a'),
-            'total_citations': citations_count,
-            'created_at': datetime.now().isoformat()
-        }
+        paper_record = PaperRecord(
+            id=paper_id,
+            title=title.strip(),
+            type=sys.intern(paper_type),
+            authors=author_ids,
+            corresponding_authors=corresponding_author_ids,
+            publication_date=parsed_date,
+            publication_year=publication_year,
+            venue_id=venue_id,
+            volume=volume,
+            issue=issue,
+            pages=pages or _NA,
+            publisher=sys.intern(publisher) if publisher else _NA,
+            abstract=abstract or _NA,
+            total_citations=citations_count,
+            created_at=_created_at or datetime.now().isoformat()
+        )
         
         # 存储论文
         self.papers[paper_id] = paper_record
+        self._index_paper(paper_record)
+        self._count_paper(paper_record)
         
-        # 更新作者的论文列表和引用数
+        # 更新作者的论文列表，引用数延迟到 finalize() 统一累加
+        authors_dict = self.authors
+        pending_author_citations = self._pending_author_citations
         for author_id in author_ids:
-            if author_id in self.authors:
-                self.authors[author_id]['papers'].append(paper_id)
-                self.authors[author_id]['total_citations'] += citations_count
-        
-        # 更新期刊/会议的论文列表和引用数
-        if venue_id and venue_id in self.venues:
-            self.venues[venue_id]['papers'].append(paper_id)
-            self.venues[venue_id]['total_citations'] += citations_count
+            author = authors_dict.get(author_id)
+            # 防御性检查：_parse_authors 已保证同一篇论文的作者ID不重复，
+            # 这里仍确保每篇论文的引用数对同一作者只累加一次
+            if author and paper_id not in author['papers']:
+                author['papers'][paper_id] = None
+                if citations_count:
+                    pending_author_citations.append((author_id, citations_count))
+        
+        # 更新期刊/会议的论文列表
+        venue = self.venues.get(venue_id) if venue_id else None
+        if venue:
+            venue['papers'][paper_id] = None
+            if citations_count:
+                self._pending_venue_citations.append((venue_id, citations_count))
         
         return paper_id
     
+    def add_papers(self, paper_data_list: Iterable[Dict]) -> List[str]:
+        """
+        批量添加论文到数据库
+        
+        整批论文的ID由一次读取的随机字节生成，并共享同一个创建时间。
+        
+        Args:
+            paper_data_list: 论文参数字典的可迭代对象，键与 add_paper 的参数一致
+            
+        Returns:
+            List[str]: 论文ID列表（与输入顺序一致）
+            
+        Raises:
+            ValueError: 输入格式错误时抛出异常（出错之前的论文已添加）
+        """
+        paper_data_list = list(paper_data_list)
+        random_bytes = os.urandom(16 * len(paper_data_list))
+        created_at = datetime.now().isoformat()
+        
+        # 循环内使用局部变量，避免每篇论文重复查找属性
+        add_paper = self.add_paper
+        paper_ids = []
+        append_id = paper_ids.append
+        for i, paper_data in enumerate(paper_data_list):
+            paper_id = _encode_id(random_bytes[i * 16:(i + 1) * 16])
+            append_id(add_paper(**paper_data, _paper_id=paper_id, _created_at=created_at))
+        
+        return paper_ids
+    
+    def finalize(self):
+        """
+        将延迟累加的引用数写回作者和期刊/会议记录
+        
+        get_author、get_venue、导出和保存时会自动调用；
+        直接读取 self.authors / self.venues 的引用数之前需要先调用本方法。
+        """
+        if not self._pending_author_citations and not self._pending_venue_citations:
+            return
+        for author_id, citations in self._pending_author_citations:
+            self.authors[author_id]['total_citations'] += citations
+        for venue_id, citations in self._pending_venue_citations:
+            self.venues[venue_id]['total_citations'] += citations
+        self._pending_author_citations = []
+        self._pending_venue_citations = []
+    
     def add_author(self, first_name: str, last_name: str, 
                    affiliation: str = None, email: str = None) -> str:
         """
@@ -427,117 +744,135 @@ class AcademicPaperDatabase:
         return self._get_or_create_author(first_name, last_name, affiliation, email)
     
     def get_paper(self, paper_id: str) -> Optional[Dict]:
-        """获取论文信息"""
-        return self.papers.get(paper_id)
+        """获取论文信息（返回字典副本，内部论文记录不对外暴露）"""
+        paper = self.papers.get(paper_id)
+        return paper.to_dict() if paper else None
     
     def get_author(self, author_id: str) -> Optional[Dict]:
-        """获取作者信息"""
-        return self.authors.get(author_id)
+        """获取作者信息（返回不含内部字段的副本，包含全名，论文集合转换为列表）"""
+        self.finalize()
+        author = self.authors.get(author_id)
+        if author is None:
+            return None
+        return self._public_author(author)
     
     def get_venue(self, venue_id: str) -> Optional[Dict]:
-        """获取期刊/会议信息"""
-        return self.venues.get(venue_id)
+        """获取期刊/会议信息（返回不含内部字段的副本，论文集合转换为列表）"""
+        self.finalize()
+        venue = self.venues.get(venue_id)
+        if venue is None:
+            return None
+        return self._public_fields(venue)
     
     def get_paper_with_details(self, paper_id: str) -> Optional[Dict]:
         """获取论文详细信息，包括作者和期刊/会议的完整信息"""
-        paper = self.get_paper(paper_id)
+        paper = self.papers.get(paper_id)
         if not paper:
             return None
         
         # 获取作者详细信息
         authors_details = []
-        for author_id in paper.get('authors', []):
-            author = self.get_author(author_id)
+        for author_id in paper.authors:
+            author = self.authors.get(author_id)
             if author:
                 authors_details.append({
                     'id': author_id,
-                    'first_name': author.get('first_name', 'n/a'),
-                    'last_name': author.get('last_name', 'n/a'),
-                    'full_name': author.get('full_name', 'n/a'),
-                    'affiliation': author.get('affiliation', 'n/a'),
-                    'email': author.get('email', 'n/a'),
-                    'is_corresponding': author_id in paper.get('corresponding_authors', [])
+                    'first_name': author.get('first_name', _NA),
+                    'last_name': author.get('last_name', _NA),
+                    'full_name': self._full_name(author),
+                    'affiliation': author.get('affiliation', _NA),
+                    'email': author.get('email', _NA),
+                    'is_corresponding': author_id in paper.corresponding_authors
                 })
         
         # 获取期刊/会议详细信息
         venue_details = None
-        if paper.get('venue_id'):
-            venue = self.get_venue(paper['venue_id'])
+        if paper.venue_id:
+            venue = self.venues.get(paper.venue_id)
             if venue:
                 venue_details = {
                     'id': venue.get('id'),
-                    'name': venue.get('name', 'n/a'),
-                    'type': venue.get('type', 'n/a'),
-                    'publisher': venue.get('publisher', 'n/a')
+                    'name': venue.get('name', _NA),
+                    'type': venue.get('type', _NA),
+                    'publisher': venue.get('publisher', _NA)
                 }
                 
                 # 添加分类信息
                 if venue.get('type') == 'journal':
                     venue_details.update({
-                        'cas_division': venue.get('cas_division', 'n/a'),
-                        'jcr_division': venue.get('jcr_division', 'n/a'),
-                        'ccf_class': venue.get('ccf_class', 'n/a')
+                        'cas_division': venue.get('cas_division', _NA),
+                        'jcr_division': venue.get('jcr_division', _NA),
+                        'ccf_class': venue.get('ccf_class', _NA)
                     })
                 elif venue.get('type') == 'conference':
                     venue_details.update({
-                        'normalized_name': venue.get('normalized_name', 'n/a'),
-                        'ccf_class': venue.get('ccf_class', 'n/a')
+                        'normalized_name': venue.get('normalized_name', _NA),
+                        'ccf_class': venue.get('ccf_class', _NA)
                     })
         
         return {
-            **paper,
+            **paper.to_dict(),
             'authors_details': authors_details,
             'venue_details': venue_details
         }
     
     def search_papers(self, **kwargs) -> List[Dict]:
-        """搜索论文"""
+        """搜索论文（返回论文字典副本的列表）"""
         results = []
-        for paper in self.papers.values():
-            match = True
-            
-            # 按标题搜索
-            if 'title' in kwargs:
-                if kwargs['title'].lower() not in paper.get('title', '').lower():
-                    match = False
-            
+        # 查询条件只在循环外处理一次
+        filter_type = 'type' in kwargs
+        type_query = kwargs.get('type')
+        year_query = str(kwargs['year']) if 'year' in kwargs else None
+        title_query = kwargs['title'].lower() if 'title' in kwargs else None
+        author_query = kwargs['author'].lower() if 'author' in kwargs else None
+        
+        # 按年份或类型搜索时只遍历对应索引中最小的候选列表
+        buckets = []
+        if year_query is not None:
+            buckets.append(self._papers_by_year.get(year_query, []))
+        if filter_type:
+            buckets.append(self._papers_by_type.get(type_query, []))
+        if buckets:
+            candidates = (self.papers[paper_id] for paper_id in min(buckets, key=len))
+        else:
+            candidates = self.papers.values()
+        
+        # 按作者搜索时先找出姓名匹配的作者，再通过作者的论文集合过滤
+        if author_query is not None:
+            author_paper_ids = set()
+            for author in self.authors.values():
+                if author_query in author['_name_lower']:
+                    author_paper_ids.update(author['papers'])
+        
+        # 按开销从低到高依次过滤，任一条件不满足即跳过
+        for paper in candidates:
             # 按类型搜索
-            if 'type' in kwargs:
-                if paper.get('type') != kwargs['type']:
-                    match = False
+            if filter_type and paper.type != type_query:
+                continue
             
             # 按年份搜索
-            if 'year' in kwargs:
-                if paper.get('publication_year'):
-                    if paper['publication_year'] != str(kwargs['year']):
-                        match = False
-                else:
-                    match = False
+            if year_query is not None and paper.publication_year != year_query:
+                continue
             
-            # 按作者搜索
-            if 'author' in kwargs:
-                author_found = False
-                for author_id in paper.get('authors', []):
-                    author = self.get_author(author_id)
-                    if author and (kwargs['author'].lower() in author.get('full_name', '').lower() or
-                                 kwargs['author'].lower() in author.get('first_name', '').lower() or
-                                 kwargs['author'].lower() in author.get('last_name', '').lower()):
-                        author_found = True
-                        break
-                if not author_found:
-                    match = False
+            # 按作者搜索（_name_lower 为 "名 姓" 的小写形式，涵盖全名、名和姓的匹配）
+            if author_query is not None and paper.id not in author_paper_ids:
+                continue
             
-            if match:
-                results.append(paper)
+            # 按标题搜索
+            if title_query is not None and title_query not in paper._title_lower:
+                continue
+            
+            results.append(paper.to_dict())
         
         return results
     
     def export_to_json(self, filename: str = None) -> Dict:
         """导出所有数据到JSON"""
+        self.finalize()
         data = {
-            'papers': self.papers,
-            'authors': self.authors,
-            'venues': self.venues,
+            'papers': self._papers_as_dicts(),
+            'authors': self._authors_as_dicts(),
+            'venues': self._strip_private_fields(self.venues),
             'metadata': {
                 'total_papers': len(self.papers),
                 'total_authors': len(self.authors),
@@ -547,34 +882,63 @@ class AcademicPaperDatabase:
         }
         
         if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 先完成序列化再打开文件，序列化失败时不会清空已有的导出文件
+            content = None
+            if orjson is not None:
+                try:
+                    # orjson 直接输出 UTF-8 字节，格式与 json.dump(indent=2) 一致
+                    content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                except orjson.JSONEncodeError:
+                    content = None  # 如超过64位的整数，改用标准库 json
+            if content is None:
+                content = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+            with open(filename, 'wb') as f:
+                f.write(content)
         
         return data
     
     def load_from_json(self, filename: str):
         """从JSON文件加载数据"""
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            # 通过 mmap 直接解析文件内容，不再先把整个文件读成字符串
+            with open(filename, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # orjson 会把超过64位的整数读成浮点数，出现19位以上的数字时改用标准库 json
+                if _WIDE_INT.search(mm) is None:
+                    with memoryview(mm) as buf:
+                        data = orjson.loads(buf)
+                else:
+                    data = json.loads(mm[:].decode('utf-8'))
+        else:
+            with open(filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
-        self.papers = data.get('papers', {})
+        self.papers = self._papers_from_dicts(data.get('papers', {}))
         self.authors = data.get('authors', {})
         self.venues = data.get('venues', {})
+        self._rebuild_indexes()
     
-    def save_to_pickle(self, filename: str, compress: bool = True):
+    def save_to_pickle(self, filename: str, compress: Union[bool, str] = True) -> str:
         """
         保存数据库对象到pickle文件
         
         Args:
             filename: 文件名
-            compress: 是否压缩文件
+            compress: 是否压缩文件；为真值（如 True）时自动选择压缩方式：安装了可选依赖 zstandard
+                时使用 zstd，扩展名为 .pkl.zst，否则使用 gzip，扩展名为 .pkl.gz，因此默认输出的
+                扩展名取决于运行环境；也可以指定 'zstd' 或 'gzip'；为假值时不压缩（.pkl）
+            
+        Returns:
+            str: 实际保存的文件名
         """
+        self.finalize()
         try:
             # 准备要保存的数据
             save_data = {
-                'papers': self.papers,
-                'authors': self.authors,
-                'venues': self.venues,
+                # 保存为普通字典和列表，保持文件格式不变
+                'papers': self._papers_as_dicts(),
+                'authors': self._authors_as_dicts(),
+                'venues': self._strip_private_fields(self.venues),
                 'metadata': {
                     'total_papers': len(self.papers),
                     'total_authors': len(self.authors),
@@ -584,33 +948,45 @@ class AcademicPaperDatabase:
                 }
             }
             
-            if compress:
+            # 除 'zstd'/'gzip' 外的真值（如 True、1）都按自动选择处理
+            if compress and not isinstance(compress, str):
+                compress = 'zstd' if zstandard is not None else 'gzip'
+            
+            # 去掉已有的扩展名，再按压缩方式添加
+            for suffix in ('.pkl.zst', '.pkl.gz', '.pkl'):
+                if filename.endswith(suffix):
+                    filename = filename[:-len(suffix)]
+                    break
+            
+            if compress == 'zstd':
+                # 使用zstd多线程压缩
+                if zstandard is None:
+                    raise ValueError("未安装 zstandard，无法使用 zstd 压缩")
+                filename += '.pkl.zst'
+                compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+                with open(filename, 'wb', buffering=_IO_BUFFER_SIZE) as raw, \
+                        compressor.stream_writer(raw) as f:
+                    pickle.dump(save_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                print(f"数据库已保存到压缩文件: {filename}")
+            elif compress == 'gzip':
                 # 使用gzip压缩
-                if not filename.endswith('.pkl.gz'):
-                    filename = filename + '.pkl.gz' if not filename.endswith('.pkl') else filename.replace('.pkl', '.pkl.gz')
-                
-                with gzip.open(filename, 'wb') as f:
+                filename += '.pkl.gz'
+                with open(filename, 'wb', buffering=_IO_BUFFER_SIZE) as raw, \
+                        gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as f:
                     pickle.dump(save_data, f, protocol=pickle.HIGHEST_PROTOCOL)
                 print(f"数据库已保存到压缩文件: {filename}")
-            else:
+            elif not compress:
                 # 不压缩
-                if not filename.endswith('.pkl'):
-                    filename = filename + '.pkl'
-                
-                with open(filename, 'wb') as f:
+                filename += '.pkl'
+                with open(filename, 'wb', buffering=_IO_BUFFER_SIZE) as f:
                     pickle.dump(save_data, f, protocol=pickle.HIGHEST_PROTOCOL)
                 print(f"数据库已保存到文件: {filename}")
-            
-            # 显示文件大小
-            file_size = os.path.getsize(filename)
-            if file_size < 1024:
-                size_str = f"{file_size} bytes"
-            elif file_size < 1024 * 1024:
-                size_str = f"{file_size / 1024:.2f} KB"
             else:
-                size_str = f"{file_size / (1024 * 1024):.2f} MB"
+                raise ValueError(f"不支持的压缩方式: {compress}")
             
-            print(f"文件大小: {size_str}")
+            # 显示文件大小
+            print(f"文件大小: {_human_size(os.stat(filename).st_size)}")
+            return filename
             
         except Exception as e:
             raise Exception(f"保存文件时发生错误: {e}")
@@ -627,22 +1003,29 @@ class AcademicPaperDatabase:
             if not os.path.exists(filename):
                 raise FileNotFoundError(f"文件不存在: {filename}")
             
-            # 检查是否为压缩文件
-            is_compressed = filename.endswith('.gz')
-            
-            if is_compressed:
-                with gzip.open(filename, 'rb') as f:
+            # 按扩展名判断压缩方式
+            if filename.endswith('.zst'):
+                if zstandard is None:
+                    raise ValueError("未安装 zstandard，无法读取 zstd 压缩文件")
+                with open(filename, 'rb', buffering=_IO_BUFFER_SIZE) as raw, \
+                        zstandard.ZstdDecompressor().stream_reader(raw) as f:
+                    data = pickle.load(f)
+                print(f"从压缩文件加载数据: {filename}")
+            elif filename.endswith('.gz'):
+                with open(filename, 'rb', buffering=_IO_BUFFER_SIZE) as raw, \
+                        gzip.GzipFile(fileobj=raw, mode='rb') as f:
                     data = pickle.load(f)
                 print(f"从压缩文件加载数据: {filename}")
             else:
-                with open(filename, 'rb') as f:
+                with open(filename, 'rb', buffering=_IO_BUFFER_SIZE) as f:
                     data = pickle.load(f)
                 print(f"从文件加载数据: {filename}")
             
             # 恢复数据
-            self.papers = data.get('papers', {})
+            self.papers = self._papers_from_dicts(data.get('papers', {}))
             self.authors = data.get('authors', {})
             self.venues = data.get('venues', {})
+            self._rebuild_indexes()
             
             # 显示加载信息
             metadata = data.get('metadata', {})
@@ -674,40 +1057,19 @@ class AcademicPaperDatabase:
         return db
     
     def get_database_stats(self) -> Dict:
-        """获取数据库统计信息"""
-        total_citations = sum(paper.get('total_citations', 0) for paper in self.papers.values())
-        
-        # 按年份统计论文数量
-        papers_by_year = {}
-        for paper in self.papers.values():
-            year = paper.get('publication_year', 'Unknown')
-            papers_by_year[year] = papers_by_year.get(year, 0) + 1
-        
-        # 按类型统计论文数量
-        papers_by_type = {}
-        for paper in self.papers.values():
-            paper_type = paper.get('type', 'Unknown')
-            papers_by_type[paper_type] = papers_by_type.get(paper_type, 0) + 1
-        
-        # 最高引用论文
-        most_cited_paper = None
-        max_citations = 0
-        for paper in self.papers.values():
-            citations = paper.get('total_citations', 0)
-            if citations > max_citations:
-                max_citations = citations
-                most_cited_paper = paper
+        """获取数据库统计信息（读取增量维护的统计值）"""
+        most_cited_paper = self.papers.get(self._most_cited_paper_id) if self._most_cited_paper_id else None
         
         return {
             'total_papers': len(self.papers),
             'total_authors': len(self.authors),
             'total_venues': len(self.venues),
-            'total_citations': total_citations,
-            'papers_by_year': papers_by_year,
-            'papers_by_type': papers_by_type,
+            'total_citations': self._total_citations,
+            'papers_by_year': dict(self._paper_count_by_year),
+            'papers_by_type': dict(self._paper_count_by_type),
             'most_cited_paper': {
-                'title': most_cited_paper.get('title', 'N/A') if most_cited_paper else 'N/A',
-                'citations': max_citations
+                'title': most_cited_paper.title,
+                'citations': self._max_citations
             } if most_cited_paper else None
         }
 
@@ -782,10 +1144,10 @@ def main():
             print(f"最高引用论文: {stats['most_cited_paper']['title']} ({stats['most_cited_paper']['citations']} 次引用)")
         
         # 保存为pickle文件（压缩）
-        db.save_to_pickle('academic_papers_compressed', compress=True)
+        compressed_file = db.save_to_pickle('academic_papers_compressed', compress=True)
         
         # 保存为pickle文件（不压缩）
-        db.save_to_pickle('academic_papers_uncompressed', compress=False)
+        uncompressed_file = db.save_to_pickle('academic_papers_uncompressed', compress=False)
         
         # 导出JSON（用于比较）
         db.export_to_json('academic_papers.json')
@@ -793,7 +1155,7 @@ def main():
         
         # 测试从pickle文件加载
         print("\n测试从pickle文件加载数据:")
-        new_db = AcademicPaperDatabase.create_from_pickle('academic_papers_compressed.pkl.gz')
+        new_db = AcademicPaperDatabase.create_from_pickle(compressed_file)
         
         # 验证加载的数据
         liu_papers = new_db.search_papers(author='Kai Liu')
@@ -801,16 +1163,9 @@ def main():
         
         # 显示文件大小比较
         print(f"\n文件大小比较:")
-        for filename in ['academic_papers.json', 'academic_papers_uncompressed.pkl', 'academic_papers_compressed.pkl.gz']:
+        for filename in ['academic_papers.json', uncompressed_file, compressed_file]:
             if os.path.exists(filename):
-                size = os.path.getsize(filename)
-                if size < 1024:
-                    size_str = f"{size} bytes"
-                elif size < 1024 * 1024:
-                    size_str = f"{size / 1024:.2f} KB"
-                else:
-                    size_str = f"{size / (1024 * 1024):.2f} MB"
-                print(f"  {filename}: {size_str}")
+                print(f"  {filename}: {_human_size(os.stat(filename).st_size)}")
         
     except ValueError as e:
         print(f"输入错误: {e}")